@@ -1,16 +1,24 @@
 import numpy as np
-from scipy.stats import zscore
 
 def detect_anomalies(series, threshold=2.5):
     """
     Detects outliers using Z-score while handling near-identical data.
+    Returns a boolean ndarray aligned with the input.
     """
-    # 1. Check if the series has zero variance (all values are identical)
-    if series.std() == 0:
-        return [False] * len(series)
-    
-    # 2. Calculate Z-score only if variance is present
-    z = zscore(series)
-    
-    # 3. Handle potential NaN results from near-zero variance
-    return np.abs(np.nan_to_num(z)) > threshold
\ No newline at end of file
+    arr = np.ascontiguousarray(series, dtype=np.float64)
+    if arr.size == 0:
+        return np.zeros(0, dtype=bool)
+
+    # 1. Deviations from the mean, computed once and reused below
+    dev = arr - arr.mean()
+
+    # 2. Population std from the same buffer (dot avoids a squared temporary)
+    sd = np.sqrt(np.dot(dev, dev) / arr.size)
+
+    # 3. Zero or undefined variance -> nothing stands out
+    if sd == 0 or not np.isfinite(sd):
+        return np.zeros(arr.shape[0], dtype=bool)
+
+    # 4. |x - mu| > threshold * sd is |z| > threshold without the divide
+    np.abs(dev, out=dev)
+    return dev > threshold * sd
\ No newline at end of file
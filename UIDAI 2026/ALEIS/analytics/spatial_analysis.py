@@ -1,4 +1,13 @@
-def region_share(df, region_col, value_col):
-    total = df[value_col].sum()
-    df["region_share"] = df[value_col] / total
-    return df
+def region_share(df, region_col, value_col, broadcast=False):
+    """
+    Share of the national value_col total contributed by each region.
+    Returns one row per region; broadcast=True instead adds the legacy
+    per-row share column to df.
+    """
+    if broadcast:
+        total = df[value_col].sum()
+        df["region_share"] = df[value_col] / total
+        return df
+
+    totals = df.groupby(region_col, observed=True)[value_col].sum()
+    return (totals / totals.sum()).rename("region_share").reset_index()
@@ -10,19 +10,35 @@ from ALEIS.main import run_aleis_pipeline
 from ALEIS.dashboards.national_dashboard import plot_trend
 from ALEIS.analytics.spatial_analysis import region_share
 
+OUTPUT_PATH = BASE_DIR / "data" / "processed" / "monthly" / "demo_indicators.parquet"
+
+def outputs_are_fresh():
+    """
+    True when the processed output is newer than every raw input and the
+    indicator config, i.e. re-running the pipeline would change nothing.
+    """
+    if not OUTPUT_PATH.exists():
+        return False
+    out_mtime = OUTPUT_PATH.stat().st_mtime
+    inputs = [*(BASE_DIR / "data" / "raw").rglob("*.csv"), BASE_DIR / "config" / "indicators.yaml"]
+    return all(p.stat().st_mtime <= out_mtime for p in inputs)
+
 def start_aleis_center():
-    # 1. Run the main processing pipeline
-    print("Step 1: Processing Raw Data...")
-    run_aleis_pipeline()
+    # 1. Run the main processing pipeline (only when inputs changed)
+    if outputs_are_fresh():
+        print("Step 1: Processed Indicators Up To Date, Skipping Pipeline...")
+    else:
+        print("Step 1: Processing Raw Data...")
+        run_aleis_pipeline()
 
-    # 2. Load the newly created processed data
+    # 2. Load the processed data
     print("Step 2: Loading Processed Indicators...")
-    df = pd.read_csv("data/processed/monthly/demo_indicators.csv")
+    df = pd.read_parquet(OUTPUT_PATH, columns=["district", "total_updates", "lepi"])
 
     # 3. Calculate Regional Insights
     print("\n--- Regional Contribution Insights ---")
     df_spatial = region_share(df, region_col="district", value_col="total_updates")
-    print(df_spatial[['district', 'region_share']].drop_duplicates())
+    print(df_spatial)
 
     # 4. Launch the Visual Dashboard
     print("\nStep 3: Launching Visual Dashboard...")
@@ -1,9 +1,11 @@
+import numpy as np
+
 def compute_lepi(freq, diversity, temporal, weights):
     """
     Life-Event Proxy Index (LEPI)
+    Accumulated term by term into a single float64 array.
     """
-    return (
-        freq * weights["frequency_weight"]
-        + diversity * weights["diversity_weight"]
-        + temporal * weights["temporal_weight"]
-    )
+    lepi = np.multiply(np.asarray(freq), weights["frequency_weight"], dtype=np.float64)
+    lepi += np.multiply(np.asarray(diversity), weights["diversity_weight"])
+    lepi += np.multiply(np.asarray(temporal), weights["temporal_weight"])
+    return lepi
\ No newline at end of file
@@ -8,7 +8,9 @@ indicator computation, validation, anomaly detection, and reporting.
 """
 
 from pathlib import Path
+from functools import lru_cache
 import yaml
+import numpy as np
 import pandas as pd
 import sys
 
@@ -34,7 +36,6 @@ from ALEIS.pipelines.validate import validate_non_negative
 # -------------------------------------------------
 from ALEIS.features.enrolment_features import enrolment_velocity
 from ALEIS.features.demographic_features import update_diversity
-from ALEIS.features.temporal_features import temporal_concentration
 
 
 # -------------------------------------------------
@@ -66,12 +67,29 @@ from ALEIS.reports.monthly_policy_brief import generate_brief
 # -------------------------------------------------
 # Config Loader
 # -------------------------------------------------
+@lru_cache(maxsize=1)
 def load_config():
+    # Parsed once per process; callers must treat the result as read-only.
     config_path = BASE_DIR / "config" / "indicators.yaml"
     with open(config_path, "r") as f:
         return yaml.safe_load(f)
 
 
+# -------------------------------------------------
+# Source Preparation
+# -------------------------------------------------
+def prepare_source(df):
+    """
+    Cleans a freshly loaded source in place: normalised columns, year/month
+    features, and categorical region keys so groupbys hash int codes.
+    """
+    clean_common_fields(df, inplace=True)
+    add_time_features(df, "date", inplace=True)
+    for col in ("state", "district"):
+        df[col] = df[col].astype("category")
+    return df
+
+
 # -------------------------------------------------
 # Main ALEIS Pipeline
 # -------------------------------------------------
@@ -87,59 +105,64 @@ def run_aleis_pipeline():
     # ---- Load datasets ----
     enrol_df = load_dataset(BASE_DIR / "data" / "raw" / "enrolment" / "enrolment.csv")
     demo_df = load_dataset(BASE_DIR / "data" / "raw" / "demographic_updates" / "demographic.csv")
-    
-    # Load Biometric dataset to ensure all three sources are reflected
-    bio_path = BASE_DIR / "data" / "raw" / "biometric" / "biometric.csv"
-    bio_df = load_dataset(bio_path) if bio_path.exists() else pd.DataFrame()
 
     # ---- Basic validation ----
     check_empty(enrol_df)
     check_empty(demo_df)
 
     # ---- Cleaning & Transformation ----
-    enrol_df = add_time_features(clean_common_fields(enrol_df), "date")
-    demo_df = add_time_features(clean_common_fields(demo_df), "date")
-    if not bio_df.empty:
-        bio_df = add_time_features(clean_common_fields(bio_df), "date")
+    prepare_source(enrol_df)
+    prepare_source(demo_df)
 
     # ---- Aggregation (Summing columns to prevent empty values) ----
+    keys = ["state", "district", "year", "month"]
+
     # 1. New Enrolments from enrolment file
-    enrol_agg = aggregate_monthly(
-        enrol_df,
-        group_cols=["state", "district", "year", "month"],
-        value_col="enrolments"
-    )
+    enrol_agg = aggregate_monthly(enrol_df, group_cols=keys, value_col="enrolments")
 
     # 2. Total Updates from demographic file (Renaming 'enrolments' to 'total_updates')
     demo_agg = aggregate_monthly(
-        demo_df,
-        group_cols=["state", "district", "year", "month"],
-        value_col="enrolments"
+        demo_df, group_cols=keys, value_col="enrolments"
     ).rename(columns={"enrolments": "total_updates"})
 
-    # 3. Biometric Updates from biometric file
-    if not bio_df.empty:
-        bio_agg = aggregate_monthly(
-            bio_df,
-            group_cols=["state", "district", "year", "month"],
-            value_col="total_updates"
-        ).rename(columns={"total_updates": "biometric_updates"})
-    else:
-        bio_agg = pd.DataFrame()
+    parts = [enrol_agg.set_index(keys), demo_agg.set_index(keys)]
+
+    # 3. Biometric Updates from biometric file, when that source is present
+    bio_path = BASE_DIR / "data" / "raw" / "biometric" / "biometric.csv"
+    if bio_path.exists():
+        bio_df = load_dataset(bio_path)
+        if not bio_df.empty:
+            prepare_source(bio_df)
+            bio_agg = aggregate_monthly(
+                bio_df, group_cols=keys, value_col="total_updates"
+            ).rename(columns={"total_updates": "biometric_updates"})
+            parts.append(bio_agg.set_index(keys))
 
     # ---- Merge everything into a single consolidated view ----
-    consolidated_agg = pd.merge(
-        enrol_agg, demo_agg, 
-        on=["state", "district", "year", "month"], 
-        how="outer"
-    ).fillna(0)
-
-    if not bio_agg.empty:
-        consolidated_agg = pd.merge(
-            consolidated_agg, bio_agg, 
-            on=["state", "district", "year", "month"], 
-            how="outer"
-        ).fillna(0)
+    # One outer join over the shared key index instead of chained merges.
+    # sort=True keeps the key order of an outer merge (enrolment_velocity
+    # below is computed row-to-row).
+    consolidated_agg = (
+        pd.concat(parts, axis=1, join="outer", sort=True)
+        .fillna(0)
+        .reset_index()
+    )
+
+    # Counts are whole numbers (float only because of the outer join's NaNs);
+    # store them in the narrowest unsigned type to shrink every later scan
+    for col in ("enrolments", "total_updates", "biometric_updates"):
+        if col in consolidated_agg:
+            consolidated_agg[col] = pd.to_numeric(consolidated_agg[col], downcast="unsigned")
+
+    # The outer join unions differing category sets back to strings
+    for col in ("state", "district"):
+        consolidated_agg[col] = consolidated_agg[col].astype("category")
+
+    # Sortable integer period key (YYYYMM) for downstream grouping
+    consolidated_agg["period_id"] = (
+        consolidated_agg["year"].astype(np.int32) * 100
+        + consolidated_agg["month"].astype(np.int32)
+    )
 
     # ---- Validation checks ----
     validate_non_negative(consolidated_agg, "enrolments")
@@ -149,10 +172,23 @@ def run_aleis_pipeline():
     # ---- Feature Engineering ----
     consolidated_agg = enrolment_velocity(consolidated_agg, "enrolments")
 
-    consolidated_agg["temporal_concentration"] = (
+    # Temporal concentration (std / mean per district): one group-level
+    # aggregation with pandas' built-in reductions, merged back onto the rows.
+    tc = (
         consolidated_agg
-        .groupby(["state", "district"])["total_updates"]
-        .transform(temporal_concentration)
+        .groupby(["state", "district"], observed=True, sort=False)["total_updates"]
+        .agg(["mean", "std"])
+    )
+    mu = tc["mean"].to_numpy(dtype=np.float64)
+    sd = tc["std"].to_numpy(dtype=np.float64)
+    tc["temporal_concentration"] = np.divide(
+        sd, mu, out=np.zeros_like(sd), where=mu != 0
+    )
+    consolidated_agg = consolidated_agg.merge(
+        tc[["temporal_concentration"]],
+        left_on=["state", "district"],
+        right_index=True,
+        how="left"
     )
 
     # ---- Indicator Computation (LEPI) ----
@@ -173,15 +209,23 @@ def run_aleis_pipeline():
     output_dir = BASE_DIR / "data" / "processed" / "monthly"
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Parquet is what the dashboards read (typed, columnar, no re-parsing);
+    # the CSV export is kept for external consumers.
+    consolidated_agg.to_parquet(
+        output_dir / "demo_indicators.parquet",
+        compression="zstd",
+        index=False
+    )
+
     consolidated_agg.to_csv(
         output_dir / "demo_indicators.csv",
         index=False
     )
 
     # ---- Policy Brief Generation ----
-    anomalies = consolidated_agg[consolidated_agg["anomaly_flag"]]
+    n_anomalies = np.count_nonzero(consolidated_agg["anomaly_flag"].to_numpy(dtype=bool))
     insight_text = (
-        f"{len(anomalies)} districts exhibit unusually high life-event intensity, "
+        f"{n_anomalies} districts exhibit unusually high life-event intensity, "
         f"suggesting elevated migration or administrative stress."
     )
     policy_brief = generate_brief(insight_text)
@@ -189,7 +233,7 @@ def run_aleis_pipeline():
     with open(BASE_DIR / "reports" / "monthly_policy_brief.md", "w") as f:
         f.write(policy_brief)
 
-    print(f"✅ ALEIS Pipeline Completed. Data saved to: {output_dir / 'demo_indicators.csv'}")
+    print(f"✅ ALEIS Pipeline Completed. Data saved to: {output_dir / 'demo_indicators.parquet'}")
 
 
 if __name__ == "__main__":
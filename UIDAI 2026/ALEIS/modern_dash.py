@@ -1,4 +1,5 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from pathlib import Path
@@ -80,15 +81,83 @@ st.markdown("""
 # =====================================================
 # DATA
 # =====================================================
+# Only the columns rendered below, with fixed dtypes so no inference is needed
+DASH_DTYPES = {
+    "state": "category",
+    "district": "category",
+    "period_id": "int32",
+    "enrolments": "float64",
+    "total_updates": "float64",
+    "lepi": "float64",
+    "anomaly_flag": "bool",
+}
+
 @st.cache_data
 def load_data():
-    path = Path("data/processed/monthly/demo_indicators.csv")
+    path = Path("data/processed/monthly/demo_indicators.parquet")
+    if path.exists():
+        return pd.read_parquet(path, columns=list(DASH_DTYPES))
+
+    # Fall back to the CSV export (e.g. the processed file shipped in data.zip,
+    # which predates period_id, so it is derived from year/month here)
+    path = path.with_suffix(".csv")
     if not path.exists():
         st.error("Data file not found")
         st.stop()
-    return pd.read_csv(path)
+    csv_dtypes = {c: t for c, t in DASH_DTYPES.items() if c != "period_id"}
+    csv_dtypes.update(year="int32", month="int32")
+    df = pd.read_csv(path, usecols=list(csv_dtypes), dtype=csv_dtypes)
+    df["period_id"] = df.pop("year") * 100 + df.pop("month")
+    return df
+
+def period_labels(period_ids):
+    """
+    YYYY-MM labels for integer year * 100 + month period ids.
+    """
+    return pd.PeriodIndex.from_fields(
+        year=period_ids // 100, month=period_ids % 100, freq="M"
+    ).astype(str)
+
+@st.cache_data
+def compute_kpis(df):
+    """
+    All dashboard aggregates in a fixed number of passes over df.
+    """
+    totals = df.agg({
+        "enrolments": "sum",
+        "total_updates": "sum",
+        "lepi": "mean",
+    })
+    alerts = np.count_nonzero(df["anomaly_flag"].to_numpy(dtype=bool))
+
+    # Severity bands counted on the raw array (NaN compares False)
+    lepi = df["lepi"].to_numpy(dtype=np.float64)
+    high = lepi > 80
+    medium = lepi > 60
+    medium &= ~high
+
+    monthly = (
+        df.groupby("period_id", sort=True)
+        .agg(lepi=("lepi","mean"))
+        .reset_index()
+    )
+    district_sum = df.groupby("district", observed=True, sort=False)["total_updates"].sum()
+
+    return {
+        "total_enrolments": int(totals["enrolments"]),
+        "total_updates": int(totals["total_updates"]),
+        "avg_lepi": totals["lepi"],
+        "alerts": int(alerts),
+        "high_alerts": int(np.count_nonzero(high)),
+        "medium_alerts": int(np.count_nonzero(medium)),
+        "peak_lepi": monthly["lepi"].max(),
+        "top_district": district_sum.idxmax(),
+        "monthly": monthly,
+        "district_sum": district_sum,
+    }
 
 df = load_data()
+kpis = compute_kpis(df)
 
 # =====================================================
 # HEADER
@@ -105,20 +174,16 @@ st.markdown("""
 # =====================================================
 # KPI CALCULATIONS
 # =====================================================
-total_enrolments = int(df["enrolments"].sum())
-total_updates = int(df["total_updates"].sum())
-avg_lepi = df["lepi"].mean()
-alerts = int(df["anomaly_flag"].sum())
-
-high_alerts = len(df[df["lepi"] > 80])
-medium_alerts = len(df[(df["lepi"] > 60) & (df["lepi"] <= 80)])
-
-peak_lepi = df.groupby(["year","month"])["lepi"].mean().max()
-top_district = (
-    df.groupby("district")["total_updates"]
-    .sum()
-    .idxmax()
-)
+total_enrolments = kpis["total_enrolments"]
+total_updates = kpis["total_updates"]
+avg_lepi = kpis["avg_lepi"]
+alerts = kpis["alerts"]
+
+high_alerts = kpis["high_alerts"]
+medium_alerts = kpis["medium_alerts"]
+
+peak_lepi = kpis["peak_lepi"]
+top_district = kpis["top_district"]
 
 # =====================================================
 # KPI ROW 1
@@ -172,13 +237,8 @@ with left:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
     st.markdown("### LEPI Temporal Trend")
 
-    df_t = (
-        df.groupby(["year","month"])
-        .agg(lepi=("lepi","mean"))
-        .reset_index()
-        .sort_values(["year","month"])
-    )
-    df_t["period"] = df_t["year"].astype(str) + "-" + df_t["month"].astype(str).str.zfill(2)
+    df_t = kpis["monthly"]
+    df_t["period"] = period_labels(df_t["period_id"])
     df_t["trend"] = df_t["lepi"].rolling(3, min_periods=1).mean()
 
     fig = go.Figure()
@@ -215,8 +275,7 @@ with right:
     st.markdown("### Top Districts by Updates")
 
     dist = (
-        df.groupby("district")["total_updates"]
-        .sum()
+        kpis["district_sum"]
         .sort_values(ascending=False)
         .head(8)
         .reset_index()
@@ -243,9 +302,12 @@ st.markdown("<br>", unsafe_allow_html=True)
 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
 st.markdown("### 🚨 District-Level Anomaly Intelligence")
 
-anom = df[df["anomaly_flag"] == True].copy()
+# Boolean mask straight from the flag column, projected to the shown columns
+mask = df["anomaly_flag"].to_numpy(dtype=bool)
+anom = df.loc[mask, ["state","district","period_id","lepi","total_updates","enrolments"]]
 if not anom.empty:
-    anom["Period"] = anom["year"].astype(str) + "-" + anom["month"].astype(str).str.zfill(2)
+    # Period labels built only for the flagged rows
+    anom = anom.assign(Period=period_labels(anom["period_id"]))
     st.dataframe(
         anom[["state","district","Period","lepi","total_updates","enrolments"]],
         use_container_width=True,
@@ -1,7 +1,8 @@
 import pandas as pd
 
-def clean_common_fields(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
+def clean_common_fields(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+    if not inplace:
+        df = df.copy()
     df.columns = df.columns.str.lower().str.strip()
-    df = df.drop_duplicates()
+    df.drop_duplicates(inplace=True)
     return df
@@ -1,8 +1,11 @@
 import pandas as pd
 
+# Region keys shared by every UIDAI source; read straight into categoricals
+KEY_DTYPES = {"state": "category", "district": "category"}
+
 def load_dataset(path: str) -> pd.DataFrame:
     """
     Loads UIDAI provided aggregated dataset.
     Raw data is NEVER modified.
     """
-    return pd.read_csv(path)
\ No newline at end of file
+    return pd.read_csv(path, engine="pyarrow", dtype=KEY_DTYPES)
\ No newline at end of file